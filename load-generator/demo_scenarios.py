@@ -6,10 +6,14 @@ These scripts demonstrate different load patterns that trigger autoscaling
 
 import asyncio
 import subprocess
+import threading
 import time
-import sys
 from datetime import datetime
 
+from kubernetes import client, config
+from kubernetes.client.rest import ApiException
+from kubernetes.config import ConfigException
+
 
 class AutoscalingDemo:
     """Demo scenarios for showcasing Kubernetes autoscaling"""
@@ -17,70 +21,101 @@ class AutoscalingDemo:
     def __init__(self, app_url: str, kubectl_context: str = None):
         self.app_url = app_url
         self.kubectl_context = kubectl_context
-        self.kubectl_cmd = ["kubectl"]
-        if kubectl_context:
-            self.kubectl_cmd.extend(["--context", kubectl_context])
-    
-    def run_kubectl(self, cmd: list) -> str:
-        """Run kubectl command and return output"""
-        full_cmd = self.kubectl_cmd + cmd
+        self._core = None
+        self._autoscaling = None
+
+    def _ensure_k8s_clients(self) -> bool:
+        """Lazily build one persistent API client instead of a kubectl
+        subprocess per poll. Lazy so commands that never touch the cluster
+        (like report) work without a kubeconfig."""
+        if self._core is not None:
+            return True
         try:
-            result = subprocess.run(full_cmd, capture_output=True, text=True, check=True)
-            return result.stdout.strip()
-        except subprocess.CalledProcessError as e:
-            print(f"Error running kubectl: {e}")
-            return ""
-    
+            config.load_kube_config(context=self.kubectl_context)
+        except ConfigException as e:
+            print(f"Error loading kubeconfig: {e}")
+            return False
+        self._core = client.CoreV1Api()
+        self._autoscaling = client.AutoscalingV2Api()
+        return True
+
     def get_pod_count(self) -> int:
         """Get current number of running pods"""
-        output = self.run_kubectl([
-            "get", "pods", 
-            "-n", "cloudapp", 
-            "-l", "app=cloudapp",
-            "--field-selector", "status.phase=Running",
-            "--no-headers"
-        ])
-        return len(output.split('\n')) if output else 0
-    
+        if not self._ensure_k8s_clients():
+            return 0
+        try:
+            pods = self._core.list_namespaced_pod(
+                "cloudapp",
+                label_selector="app=cloudapp",
+                field_selector="status.phase=Running"
+            )
+            return len(pods.items)
+        except ApiException as e:
+            print(f"Error listing pods: {e}")
+            return 0
+
     def get_hpa_status(self) -> dict:
         """Get HPA current status"""
-        output = self.run_kubectl([
-            "get", "hpa", 
-            "-n", "cloudapp", 
-            "cloudapp-hpa",
-            "-o", "jsonpath={.status.currentReplicas},{.status.desiredReplicas},{.status.currentCPUUtilizationPercentage}"
-        ])
-        if output:
-            parts = output.split(',')
-            return {
-                'current_replicas': int(parts[0]) if parts[0] else 0,
-                'desired_replicas': int(parts[1]) if len(parts) > 1 and parts[1] else 0,
-                'cpu_utilization': int(parts[2]) if len(parts) > 2 and parts[2] else 0
-            }
-        return {'current_replicas': 0, 'desired_replicas': 0, 'cpu_utilization': 0}
+        if not self._ensure_k8s_clients():
+            return {'current_replicas': 0, 'desired_replicas': 0, 'cpu_utilization': 0}
+        try:
+            hpa = self._autoscaling.read_namespaced_horizontal_pod_autoscaler(
+                "cloudapp-hpa", "cloudapp"
+            )
+        except ApiException as e:
+            print(f"Error reading HPA: {e}")
+            return {'current_replicas': 0, 'desired_replicas': 0, 'cpu_utilization': 0}
+
+        cpu_utilization = 0
+        for metric in hpa.status.current_metrics or []:
+            if metric.type == 'Resource' and metric.resource.name == 'cpu':
+                cpu_utilization = metric.resource.current.average_utilization or 0
+
+        return {
+            'current_replicas': hpa.status.current_replicas or 0,
+            'desired_replicas': hpa.status.desired_replicas or 0,
+            'cpu_utilization': cpu_utilization
+        }
     
-    def monitor_scaling(self, duration: int = 300):
+    def monitor_scaling(self, duration: int = 300, stop: threading.Event = None):
         """Monitor and display scaling metrics"""
         print(f"\n{'='*60}")
         print("KUBERNETES AUTOSCALING MONITOR")
         print(f"{'='*60}")
         print(f"{'Time':<20} {'Pods':<6} {'CPU%':<6} {'Desired':<8} {'Status'}")
         print("-" * 60)
-        
+
+        if stop is None:
+            stop = threading.Event()
+
         start_time = time.time()
-        while time.time() - start_time < duration:
+        while time.time() - start_time < duration and not stop.is_set():
             pod_count = self.get_pod_count()
             hpa_status = self.get_hpa_status()
-            
+
             current_time = datetime.now().strftime("%H:%M:%S")
             status = "Scaling Up" if hpa_status['desired_replicas'] > hpa_status['current_replicas'] else \
                     "Scaling Down" if hpa_status['desired_replicas'] < hpa_status['current_replicas'] else \
                     "Stable"
-            
+
             print(f"{current_time:<20} {pod_count:<6} {hpa_status['cpu_utilization']:<6} "
                   f"{hpa_status['desired_replicas']:<8} {status}")
-            
-            time.sleep(10)
+
+            if stop.wait(10):
+                break
+
+    def start_monitor(self, duration: int) -> threading.Event:
+        """Run monitor_scaling in a background thread, no subprocess spawn.
+        Returns the Event that stops the monitor."""
+        stop = threading.Event()
+        thread = threading.Thread(
+            target=self.monitor_scaling,
+            args=(duration,),
+            kwargs={'stop': stop},
+            daemon=True
+        )
+        thread.start()
+        return stop
     
     async def scenario_1_gradual_ramp(self):
         """Scenario 1: Gradual load increase to demonstrate scale-out"""
@@ -90,11 +125,7 @@ class AutoscalingDemo:
         print("Expected behavior: Pods should scale from 2 to ~8 over 10 minutes")
         
         # Start monitoring in background
-        monitor_process = subprocess.Popen([
-            sys.executable, __file__, "monitor", 
-            "--url", self.app_url, 
-            "--duration", "600"
-        ])
+        monitor_stop = self.start_monitor(600)
         
         # Run load test
         print("\nStarting gradual ramp load test...")
@@ -109,7 +140,7 @@ class AutoscalingDemo:
             "--charts"
         ])
         
-        monitor_process.terminate()
+        monitor_stop.set()
         print("\n Scenario 1 completed!")
     
     async def scenario_2_spike_test(self):
@@ -120,11 +151,7 @@ class AutoscalingDemo:
         print("Expected behavior: Quick scale-out during spikes, scale-in during quiet periods")
         
         # Start monitoring
-        monitor_process = subprocess.Popen([
-            sys.executable, __file__, "monitor",
-            "--url", self.app_url,
-            "--duration", "480"
-        ])
+        monitor_stop = self.start_monitor(480)
         
         # Run spike test
         print("\nStarting spike load test...")
@@ -140,7 +167,7 @@ class AutoscalingDemo:
             "--charts"
         ])
         
-        monitor_process.terminate()
+        monitor_stop.set()
         print("\n Scenario 2 completed!")
     
     async def scenario_3_sustained_load(self):
@@ -151,11 +178,7 @@ class AutoscalingDemo:
         print("Expected behavior: Stable scaling to handle consistent load")
         
         # Start monitoring
-        monitor_process = subprocess.Popen([
-            sys.executable, __file__, "monitor",
-            "--url", self.app_url,
-            "--duration", "300"
-        ])
+        monitor_stop = self.start_monitor(300)
         
         # Run sustained load test
         print("\nStarting sustained load test...")
@@ -169,7 +192,7 @@ class AutoscalingDemo:
             "--charts"
         ])
         
-        monitor_process.terminate()
+        monitor_stop.set()
         print("\n Scenario 3 completed!")
     
     async def scenario_4_cpu_intensive(self):
@@ -183,32 +206,26 @@ class AutoscalingDemo:
         import aiohttp
         
         async def cpu_intensive_load():
-            async with aiohttp.ClientSession() as session:
-                tasks = []
-                for _ in range(50):  # 50 concurrent CPU-intensive requests
-                    task = asyncio.create_task(session.post(
+            # Fire the burst concurrently - the old 0.1s stagger serialized
+            # this to 10 RPS and the CPU load never actually spiked
+            connector = aiohttp.TCPConnector(limit=200, keepalive_timeout=30)
+            async with aiohttp.ClientSession(connector=connector) as session:
+                tasks = [
+                    session.post(
                         f"{self.app_url}/api/cpu-intensive",
-                        json={"iterations": 500000}
-                    ))
-                    tasks.append(task)
-                    
-                    # Stagger requests
-                    await asyncio.sleep(0.1)
-                
-                # Wait for all requests to complete
+                        json={"iterations": 500000, "simulate": True}
+                    )
+                    for _ in range(50)  # 50 concurrent CPU-intensive requests
+                ]
                 await asyncio.gather(*tasks, return_exceptions=True)
         
         # Start monitoring
-        monitor_process = subprocess.Popen([
-            sys.executable, __file__, "monitor",
-            "--url", self.app_url,
-            "--duration", "180"
-        ])
+        monitor_stop = self.start_monitor(180)
         
         print("\nStarting CPU-intensive load test...")
         await cpu_intensive_load()
         
-        monitor_process.terminate()
+        monitor_stop.set()
         print("\n Scenario 4 completed!")
     
     def generate_demo_report(self):
@@ -216,9 +233,10 @@ class AutoscalingDemo:
         print("\n GENERATING DEMO REPORT")
         print("="*50)
         
-        import json
         import matplotlib.pyplot as plt
-        
+        import numpy as np
+        import orjson
+
         scenarios = [
             ("scenario1_results.json", "Gradual Ramp"),
             ("scenario2_results.json", "Load Spikes"),
@@ -230,24 +248,29 @@ class AutoscalingDemo:
         
         for i, (filename, title) in enumerate(scenarios):
             try:
-                with open(filename, 'r') as f:
-                    data = json.load(f)
-                
-                stats = data['stats']
-                ax = axes[i//2, i%2] if i < 3 else None
-                
-                if ax and stats:
-                    # Plot response time distribution
-                    response_times = [r['response_time'] * 1000 for r in data['results'] 
-                                    if r['status_code'] < 400]
-                    ax.hist(response_times, bins=30, alpha=0.7)
-                    ax.set_title(f'{title}\nAvg: {stats["average_response_time"]*1000:.1f}ms')
-                    ax.set_xlabel('Response Time (ms)')
-                    ax.set_ylabel('Frequency')
-                
+                with open(filename, 'rb') as f:
+                    data = orjson.loads(f.read())
             except FileNotFoundError:
                 print(f"Results file {filename} not found")
                 continue
+
+            stats = data['stats']
+            ax = axes[i//2, i%2] if i < 3 else None
+
+            if ax and stats:
+                # Plot response time distribution: filter errors and
+                # convert to ms in one vectorized pass, then bin with
+                # np.histogram instead of matplotlib's internal loop
+                results = np.fromiter(
+                    ((r['response_time'], r['status_code']) for r in data['results']),
+                    dtype=[('rt', 'f8'), ('sc', 'i4')]
+                )
+                response_times = results['rt'][results['sc'] < 400] * 1000.0
+                counts, edges = np.histogram(response_times, bins=30)
+                ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', alpha=0.7)
+                ax.set_title(f'{title}\nAvg: {stats["average_response_time"]*1000:.1f}ms')
+                ax.set_xlabel('Response Time (ms)')
+                ax.set_ylabel('Frequency')
         
         # Summary metrics in the last subplot
         ax = axes[1, 1]